@@ -1,13 +1,27 @@
 # import the csv file
 import csv
-from collections import Counter, defaultdict
-from datetime import datetime
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 
 INPUT_CSV = "network_incidents.csv"
 OUT_TXT = "incident_analysis.txt"
+IO_BUFFER_SIZE = 1024 * 1024  # read and write files in 1 MiB chunks instead of 8 KiB
+
+# report separators, built once instead of on every write
+SEP90 = "=" * 90 + "\n"
+SEP75 = "=" * 75 + "\n"
+DASH90 = "-" * 90 + "\n"
+DASH75 = "-" * 75 + "\n"
 
 
 # helper function 1, parse swedish formatted currency 1 234,50 -> "1234.50"
+# one translate call drops the spaces and swaps the decimal comma
+
+_SWEDISH_FLOAT_TRANS = str.maketrans({" ": None, ",": "."})
 
 def parse_swedish_float(s):
     if s is None:
@@ -18,7 +32,7 @@ def parse_swedish_float(s):
     if s == "":
         return 0.0
     try:
-        return float(s.replace(" ", "").replace(",", "."))
+        return float(s.translate(_SWEDISH_FLOAT_TRANS))
     except ValueError:
         return 0.0
     
@@ -31,11 +45,27 @@ def safe_int(value, default=0):
         return default
     
 # helper function 3, flexible date parsing
+# the same dates repeat across rows, so results are cached
 
+@lru_cache(maxsize=1024)
 def parse_date_flex(s):
     if not s:
         return None
     s = str(s).strip()
+
+    # fast path for 2024-09-02, 2024/09/02 and 02-09-2024 without strptime,
+    # only taken for all-digit fields so it accepts nothing strptime rejects
+    if len(s) == 10 and s.isascii():
+        try:
+            if (s[4] == s[7] and s[4] in "-/"
+                    and s[0:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit()):
+                return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+            if (s[2] == s[5] == "-"
+                    and s[0:2].isdigit() and s[3:5].isdigit() and s[6:10].isdigit()):
+                return date(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+        except ValueError:
+            pass
+
     for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%y"):
         try:
             return datetime.strptime(s, fmt).date()
@@ -48,15 +78,15 @@ def parse_date_flex(s):
     
 # helper function 4, format float value into Swedish currency string 1234.5 -> "1 234,50"
 
+_SEK_TRANS = str.maketrans({",": " ", ".": ","})
+
 def format_sek(v):
     try:
         x = float(v)
     except Exception:
         x = 0.0
 
-    s = f"{x:,.2f}"
-    s = s.replace(",", "X").replace(".", ",").replace("X", " ")
-    return s
+    return f"{x:,.2f}".translate(_SEK_TRANS)
 
 # helper function 5, consistent table rows
 
@@ -86,96 +116,276 @@ def format_columns(values, widths, aligns=None, sep=" "):
             formatted.append(text.ljust(w))
     return sep.join(formatted) + "\n"
 
-# read csv using csv.DictReader
+# helper function 6, fixed report table rows
+# same output as format_columns(values, [18] * n) without the zip and list per row
+
+def _row3(a, b, c):
+    return f"{a!s:<18} {b!s:<18} {c!s:<18}\n"
+
+def _row4(a, b, c, d):
+    return f"{a!s:<18} {b!s:<18} {c!s:<18} {d!s:<18}\n"
+
+def _row5(a, b, c, d, e):
+    return f"{a!s:<18} {b!s:<18} {c!s:<18} {d!s:<18} {e!s:<18}\n"
+
+# one parsed incident, slotted so each row is a fixed-size object without
+# a per-row dict, missing columns fall back to the defaults below
+
+class Incident:
+    __slots__ = (
+        "ticket_id", "week_number", "site", "device_hostname", "severity",
+        "category", "description", "reported_by", "resolution_minutes",
+        "affected_users", "cost_sek", "impact_score", "resolution_notes",
+        "date_raw", "date_parsed"
+    )
+
+    def __init__(self, ticket_id="", week_number=0, site="", device_hostname="",
+                 severity="", category="", description="", reported_by="",
+                 resolution_minutes=0, affected_users=0, cost_sek=0.0,
+                 impact_score=0.0, resolution_notes="", date_raw="", date_parsed=None):
+        self.ticket_id = ticket_id
+        self.week_number = week_number
+        self.site = site
+        self.device_hostname = device_hostname
+        self.severity = severity
+        self.category = category
+        self.description = description
+        self.reported_by = reported_by
+        self.resolution_minutes = resolution_minutes
+        self.affected_users = affected_users
+        self.cost_sek = cost_sek
+        self.impact_score = impact_score
+        self.resolution_notes = resolution_notes
+        self.date_raw = date_raw
+        self.date_parsed = date_parsed
+
+# csv columns read into an Incident, in the order read_incidents unpacks them
+CSV_COLUMNS = (
+    "ticket_id", "week_number", "site", "device_hostname", "severity",
+    "category", "description", "reported_by", "resolution_minutes",
+    "affected_users", "cost_sek", "impact_score", "resolution_notes",
+    "date", "incident_date"
+)
+
+# read csv using csv.reader, column positions come from the header once
+# rows are yielded one at a time so the whole file is never held in memory
+
+def read_incidents(input_csv=INPUT_CSV):
+    with open(input_csv, newline="", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next((rec for rec in reader if rec), [])
+        width = len(header)
+
+        # columns missing from the header point at the empty slot appended
+        # to every record below
+        pos = {name: i for i, name in enumerate(header)}
+        pick = itemgetter(*(pos.get(name, width) for name in CSV_COLUMNS))
+
+        for rec in reader:
+            if not rec:
+                continue  # blank line, DictReader skipped these too
+            if len(rec) != width:
+                rec = (rec + [""] * width)[:width]
+            rec.append("")
+
+            (ticket_id, week_number, site, device_hostname, severity,
+             category, description, reported_by, resolution_minutes,
+             affected_users, cost_sek, impact_score, resolution_notes,
+             date_col, incident_date) = map(str.strip, pick(rec))
+            date_raw = date_col or incident_date
+
+            yield Incident(
+                ticket_id,
+                safe_int(week_number),
+                site,
+                device_hostname,
+                severity.lower(),
+                category,
+                description,
+                reported_by,
+                safe_int(resolution_minutes),
+                safe_int(affected_users),
+                parse_swedish_float(cost_sek),
+                parse_swedish_float(impact_score),
+                resolution_notes,
+                date_raw,
+                parse_date_flex(date_raw),
+            )
+
+# aggregate the incidents into per-group totals, only the summaries,
+# the top 5 heap and the big incidents are kept once a row is counted
 
 def network_incidents(input_csv=INPUT_CSV):
-    rows = []
-    with open(input_csv, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f) 
-        for r in reader:
-            row = {k: (v.strip() if isinstance(v, str) else v) for k, v in r.items()}
-
-            row["week_number"] = safe_int(row.get("week_number", 0))
-            row["resolution_minutes"] = safe_int(row.get("resolution_minutes"))
-            row["affected_users"] = safe_int(row.get("affected_users"), default=0)           
-            row["cost_sek"] = parse_swedish_float(row.get("cost_sek"))    
-            row["severity"] = (row.get("severity") or "").strip().lower()
-            row["_date_raw"] = (row.get("date") or row.get("incident_date") or "")
-            row["_date_parsed"] = parse_date_flex(row["_date_raw"])                   
-
-            rows.append(row)
-
-    if not rows:
-        raise SystemExit("No rows read from CSV. Check file content.")
+    severity_map = {"critical": 4, "high": 3, "medium": 2, "low": 1}
+    type_map = {
+        "SW": "switch", "AP": "access_point", "RT": "router", 
+        "FW": "firewall", "LB": "load_balancer"
+    }
 
-    # summary
+    total_incidents = 0
+    total_cost = 0.0
+    first_date = last_date = None
+    min_week = max_week = 0
+    sev_counts = Counter()
+    by_severity = {}
+    big_incidents = []
+    top5_heap = []
+    cat_scores = {}
+    site_summary = {}
+    device_summary = {}
+    weekly_summary = {}
 
-    total_incidents = len(rows)
-    total_cost = sum(r.get("cost_sek", 0.0) for r in rows)
-    sites = sorted({r.get("site") or "UNKNOWN" for r in rows})
-    dates = sorted({r["_date_parsed"] for r in rows if r["_date_parsed"]})
-    if dates:
-        period = f"{dates[0].isoformat()} to {dates[-1].isoformat()}"
-    else:
-        weeks = sorted({r["week_number"] for r in rows if r["week_number"]})
-        if weeks:
-            if min(weeks) == max(weeks):
-                period = f"Week {min(weeks)}"
-            else:
-                period = f"Weeks {min(weeks)}-{max(weeks)}"
+    for i, r in enumerate(read_incidents(input_csv)):
+        site = r.site or "UNKNOWN"
+        sev = r.severity
+        dev = r.device_hostname or "UNKNOWN"
+        cat = r.category or "UNKNOWN"
+        cost = r.cost_sek
+        res = r.resolution_minutes
+        users = r.affected_users
+        week = r.week_number
+        score = r.impact_score
+        parsed = r.date_parsed
+
+        # summary
+        total_incidents += 1
+        total_cost += cost
+        if parsed:
+            if first_date is None or parsed < first_date:
+                first_date = parsed
+            if last_date is None or parsed > last_date:
+                last_date = parsed
+        if week:
+            if not min_week or week < min_week:
+                min_week = week
+            if not max_week or week > max_week:
+                max_week = week
+
+        # per severity, counts live in sev_counts so only the sums are kept here
+        sev_key = sev or "unknown"
+        sev_counts[sev_key] += 1
+        totals = by_severity.get(sev_key)
+        if totals is None:
+            totals = by_severity[sev_key] = [0, 0.0]  # total_res, total_cost
+        totals[0] += res
+        totals[1] += cost
+
+        # incidents affecting more than 100 users
+        if users > 100:
+            big_incidents.append(r)
+
+        # top 5 by cost, ties keep file order like sorted() does
+        entry = (cost, -i, r)
+        if len(top5_heap) < 5:
+            heapq.heappush(top5_heap, entry)
+        elif entry > top5_heap[0]:
+            heapq.heapreplace(top5_heap, entry)
+
+        # impact score per category
+        data = cat_scores.setdefault(cat, {"count": 0, "total": 0.0})
+        data["count"] += 1
+        data["total"] += score
+
+        # incidents_by_site.csv
+        data = site_summary.setdefault(site, {
+            "count": 0, "total_cost": 0.0, "total_res": 0,
+            "critical": 0, "high": 0, "medium": 0, "low": 0
+        })
+        data["count"] += 1
+        data["total_res"] += res
+        data["total_cost"] += cost
+        if sev in ("critical", "high", "medium", "low"):
+            data[sev] += 1
+
+        # problem_devices.csv
+        data = device_summary.get(dev)
+        if data is None:
+            data = device_summary[dev] = {
+                "site": site,
+                "device_type": type_map.get(dev.split("-")[0], "other"),
+                "count": 0, "sev_total": 0, "total_cost": 0.0, "total_users": 0,
+                "last_week": week, "weeks": set()
+            }
+        data["count"] += 1
+        data["sev_total"] += severity_map.get(sev or "unknown", 0)
+        data["total_cost"] += cost
+        data["total_users"] += users
+        if week > data["last_week"]:
+            data["last_week"] = week
+        if week:
+            data["weeks"].add(week)
+
+        # cost_analysis.csv
+        if week and 1 <= week <= 52:
+            data = weekly_summary.setdefault(week, {"score_count": 0, "score_total": 0.0, "total_cost": 0.0})
+            data["total_cost"] += cost
+            data["score_count"] += 1
+            data["score_total"] += score
+
+    if not total_incidents:
+        raise SystemExit("No rows read from CSV. Check file content.")
+
+    sites = sorted(site_summary)
+    if first_date:
+        period = f"{first_date.isoformat()} to {last_date.isoformat()}"
+    elif max_week:
+        if min_week == max_week:
+            period = f"Week {min_week}"
         else:
-            period = "Unknown period"
+            period = f"Weeks {min_week}-{max_week}"
+    else:
+        period = "Unknown period"
 
-    sev_counts = Counter((r.get("severity") or "unknown") for r in rows)
-    per_severity = {}
-    for sev in sorted(set(sev_counts.keys())):
-        grp = [r for r in rows if r.get("severity") == sev]
-        cnt = len(grp)
-        avg_res = int(round(sum(r.get("resolution_minutes", 0) for r in grp) /cnt)) if cnt else 0
-        avg_cost = round(sum(r.get("cost_sek", 0.0) for r in grp) / cnt, 2) if cnt else 0.0
-        per_severity[sev] = {"count": cnt, "avg_res": avg_res, "avg_cost": avg_cost}
-
-    big_incidents = [r for r in rows if r.get("affected_users", 0) > 100]
-    top5 = sorted(rows, key=lambda x: x.get("cost_sek", 0.0), reverse=True)[:5]
-    device_counts = Counter(r.get("device_hostname") or "UNKNOWN" for r in rows)
+    top5 = [entry[2] for entry in sorted(top5_heap, reverse=True)]
+    # the per-group counts are already in the summaries, so the counters are
+    # built from those instead of another count per row
+    device_counts = Counter({dev: data["count"] for dev, data in device_summary.items()})
+    cat_counts = Counter({cat: data["count"] for cat, data in cat_scores.items()})
     recurring = {d: c for d, c in device_counts.items() if c > 1}
 
-    cat_scores = defaultdict(list)
-    for r in rows:
-        cat = r.get("category") or "UNKNOWN"
-        try:
-            score = parse_swedish_float(r.get("impact_score"))
-            cat_scores[cat].append(score)
-        except Exception:
-            pass
+    per_severity = {}
+    for sev, cnt in sorted(sev_counts.items()):
+        total_res, total_cost_sev = by_severity[sev]
+        per_severity[sev] = {
+            "count": cnt,
+            "avg_res": int(round(total_res / cnt)),
+            "avg_cost": round(total_cost_sev / cnt, 2)
+        }
 
     avg_cat_scores = {
-        cat: round(sum(vals) / len(vals), 1)
-        for cat, vals in cat_scores.items() if vals
+        cat: round(data["total"] / data["count"], 1)
+        for cat, data in cat_scores.items() if data["count"]
     }
-    cat_counts = Counter(r.get("category") or "UNKNOWN" for r in rows)
-
-    # incidents_by_site.csv
-    site_summary = {}
-    for r in rows:
-        site = r.get("site") or "UNKNOWN"
-        sev = r.get("severity") or ""
-        if site not in site_summary:
-            site_summary[site] = {
-                "count": 0, "total_cost": 0.0, "total_res": 0,
-                "critical": 0, "high": 0, "medium": 0, "low": 0
-                }
-        site_summary[site]["count"] += 1
-        site_summary[site]["total_res"] += r.get("resolution_minutes", 0)
-        site_summary[site]["total_cost"] += r.get("cost_sek", 0.0)
-
-        if sev in ("critical", "high", "medium", "low"):
-            site_summary[site][sev] += 1
 
     for site, data in site_summary.items():
         data["avg_res"] = round(data["total_res"] / data["count"], 1) if data["count"] else 0
 
-    with open("incidents_by_site.csv", "w", newline="", encoding="utf-8") as f:
+    for dev, data in device_summary.items():
+        data["recent"] = data["last_week"] >= max_week - 1
+
+    return {
+        "total_incidents": total_incidents,
+        "total_cost": total_cost,
+        "sites": sites,
+        "period": period,
+        "sev_counts": sev_counts,
+        "per_severity": per_severity,
+        "big_incidents": big_incidents,
+        "top5": top5,
+        "recurring_devices": recurring,
+        "device_counts": device_counts,
+        "device_summary": device_summary,
+        "site_summary": site_summary,
+        "weekly_summary": weekly_summary,
+        "avg_cat_scores": avg_cat_scores,
+        "cat_counts": cat_counts
+}
+
+# incidents_by_site.csv
+# each file is built as a list of rows and handed to writerows in one call
+
+def incidents_by_site(results, out_csv="incidents_by_site.csv"):
+    with open(out_csv, "w", newline="", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         fieldnames = [
             "Site",
             "Total Incidents",
@@ -186,55 +396,26 @@ def network_incidents(input_csv=INPUT_CSV):
             "Avg Resolution (min)", 
             "Total Cost (SEK)"
         ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for site , data in site_summary.items():
-            writer.writerow({
-                "Site": site,
-                "Total Incidents": data["count"],
-                "Critical Incidents": data["critical"],
-                "High Incidents": data["high"],
-                "Medium Incidents": data["medium"],
-                "Low Incidents": data["low"],
-                "Avg Resolution (min)": data["avg_res"],
-                "Total Cost (SEK)": format_sek(data["total_cost"])
-            })
-
-    # problem_devices.csv
-    severity_map = {"critical": 4, "high": 3, "medium": 2, "low": 1}
-    type_map = {
-        "SW": "switch", "AP": "access_point", "RT": "router", 
-        "FW": "firewall", "LB": "load_balancer"
-    }
-    device_summary = {}
-    max_week = max((r["week_number"] for r in rows if r["week_number"]), default=0)
-
-    for r in rows:
-        dev = r.get("device_hostname") or "UNKNOWN"
-        site = r.get("site") or "UNKNOWN"
-        sev = (r.get("severity") or "unknown").lower()
-        cost = r.get("cost_sek", 0.0)
-        users = r.get("affected_users", 0)
-        week = r.get("week_number", 0)
-
-        if dev not in device_summary:
-            device_summary[dev] = {
-                "site": site,
-                "device_type": type_map.get(dev.split("-")[0], "other"),
-                "count": 0, "sev_scores":[], "total_cost":0.0, "total_users":0, 
-                "recent":False
-            }
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([
+            (
+                site,
+                data["count"],
+                data["critical"],
+                data["high"],
+                data["medium"],
+                data["low"],
+                data["avg_res"],
+                format_sek(data["total_cost"])
+            )
+            for site, data in results["site_summary"].items()
+        ])
 
-        data = device_summary[dev]
-        data["count"] += 1
-        data["sev_scores"].append(severity_map.get(sev.lower(), 0))
-        data["total_cost"] += cost
-        data["total_users"] += users
-        if week >= max_week - 1:
-            data["recent"] = True
+# problem_devices.csv
 
-    with open("problem_devices.csv", "w", newline="", encoding="utf-8") as f:
+def problem_devices(results, out_csv="problem_devices.csv"):
+    with open(out_csv, "w", newline="", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         fieldnames = [
             "device_hostname", 
             "site", "device_type", 
@@ -244,257 +425,208 @@ def network_incidents(input_csv=INPUT_CSV):
             "avg_affected_users",
             "in_last_weeks_warnings"
         ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for dev, data in sorted(device_summary.items(),
-                             key=lambda x: (x[1]["count"], x[1]["total_cost"]),
-                             reverse=True):
-            avg_sev = (sum(data["sev_scores"]) / len(data["sev_scores"])) if data["sev_scores"] else 0
-            avg_users = (data["total_users"] / data["count"]) if data["count"] else 0                              
-            
-            writer.writerow({
-                "device_hostname": dev,
-                "site": data["site"],
-                "device_type": data["device_type"],
-                "incident_count": data ["count"],
-                "avg_severity_score": f"{avg_sev:.2f}",
-                "total_cost_sek": format_sek(data["total_cost"]),
-                "avg_affected_users": f"{avg_users:.2f}",
-                "in_last_weeks_warnings": "yes" if data["recent"] else "no"                 
-            }) 
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([
+            (
+                dev,
+                data["site"],
+                data["device_type"],
+                data["count"],
+                f"{data['sev_total'] / data['count']:.2f}",
+                format_sek(data["total_cost"]),
+                f"{data['total_users'] / data['count']:.2f}",
+                "yes" if data["recent"] else "no"
+            )
+            for dev, data in sorted(results["device_summary"].items(),
+                                    key=lambda x: (x[1]["count"], x[1]["total_cost"]),
+                                    reverse=True)
+        ])
 
 # cost_analysis.csv
 
-    weekly_summary = {}
-
-    for r in rows:
-        week = r.get("week_number")
-        if not week or week <1 or week > 52:
-            continue
-        if week not in weekly_summary:
-            weekly_summary[week] = {"impact_scores": [],"total_cost": 0.0,}
-
-        weekly_summary[week]["total_cost"] += r.get("cost_sek", 0.0)
-
-        try:
-            score = parse_swedish_float(r.get("impact_score"))
-            weekly_summary[week]["impact_scores"].append(score)
-        except Exception:
-            pass
-
-    with open("cost_analysis.csv", "w", newline="", encoding="utf-8") as f:
+def cost_analysis(results, out_csv="cost_analysis.csv"):
+    with open(out_csv, "w", newline="", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         fieldnames = [
             "week_number", 
             "avg_impact_score", 
             "total_cost_sek"
         ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for week in sorted(weekly_summary.keys()):
-            data = weekly_summary[week]
-            avg_score = round(sum(data["impact_scores"]) / len(data["impact_scores"]), 2) if data["impact_scores"] else 0
-            
-            writer.writerow({
-                "week_number": week,
-                "avg_impact_score": f"{avg_score:.2f}".replace(".", ","), 
-                "total_cost_sek": format_sek(data["total_cost"])
-            })      
-
-    return {
-        "rows": rows,
-        "total_incidents": total_incidents,
-        "total_cost": total_cost,
-        "sites": sites,
-        "period": period,
-        "sev_counts": sev_counts,
-        "per_severity": per_severity,
-        "big_incidents": big_incidents,
-        "top5": top5,
-        "recurring_devices": recurring,
-        "device_counts": device_counts,
-        "site_summary": site_summary,
-        "avg_cat_scores": avg_cat_scores,
-        "cat_counts": cat_counts
-}
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([
+            (
+                week,
+                f"{round(data['score_total'] / data['score_count'], 2):.2f}".replace(".", ","),
+                format_sek(data["total_cost"])
+            )
+            for week, data in sorted(results["weekly_summary"].items())
+        ])
 
 # incident_analysis.txt
 
 def incident_analysis(results, out_txt=OUT_TXT):
-    with open(out_txt, "w", encoding="utf-8") as f:
-
-        # INCIDENT ANALYSIS - TechCorp AB
-        f.write("=" * 90 + "\n")
-        f.write(format_columns(
-            ["INCIDENT ANALYSIS - TechCorp AB ", f"Report period: {results['period']}"],
-            [45, 40],
-            ["l", "r"]
+    # the report is collected as a list of parts and written in one go
+    parts = []
+    write = parts.append
+
+    # INCIDENT ANALYSIS - TechCorp AB
+    write(SEP90)
+    write(format_columns(
+        ["INCIDENT ANALYSIS - TechCorp AB ", f"Report period: {results['period']}"],
+        [45, 40],
+        ["l", "r"]
+    ))
+    write(SEP90)
+    write(f"Sites covered: {', '.join(results['sites'])}\n\n")
+    write(f"Total incidents: {results['total_incidents']}\n")
+    write(f"Total cost (SEK): {format_sek(results['total_cost'])}\n\n")
+
+    # executive summary
+    write("\n" + SEP90)
+    write("Executive Summary:")
+    write("\n" + SEP90)
+
+    tor02 = results["device_summary"].get("SW-DC-TOR-02")
+    if tor02:
+        write(
+            f"⚠ CRITICAL: SW-DC-TOR–02 stands out as the most frequent device with repeated failures\n"
+            f"({tor02['count']} incidents across {len(tor02['weeks'])} weeks)\n\n"
+        )
+        
+    if results["top5"]:
+        most_expensive = results["top5"][0]
+        write(
+            f"⚠ Most expensive incident: {format_sek(most_expensive.cost_sek)} SEK "
+            f"(Ticket {most_expensive.ticket_id}, {most_expensive.device_hostname}, "
+            f"{most_expensive.site})\n\n"
+        )
+
+    total = results['total_incidents']
+    crit_count = results["per_severity"].get("critical", {}).get("count", 0)
+    non_crit = total - crit_count
+    write(
+        f"✓ Majority of incidents were non-critical ({non_crit} of {total})\n\n"
+        )
+
+    # incidents by severity
+    write("\n" + SEP75)
+    write("Incidents by severity:")
+    write("\n" + SEP75)
+    write(_row4("Severity", "Count", "Avg Res (min)", "Avg Cost (SEK)"))
+    write(DASH75)
+    severity_order = {"critical":1, "high": 2, "medium": 3, "low": 4}
+    for sev, data in sorted(results["per_severity"].items(), 
+        key=lambda x: severity_order.get(x[0].lower(), 99)):
+        write(_row4(
+            sev.capitalize(), 
+            data['count'], 
+            data['avg_res'], 
+            format_sek(data['avg_cost'])
         ))
-        f.write("=" * 90 + "\n")
-        f.write(f"Sites covered: {', '.join(results['sites'])}\n\n")
-        f.write(f"Total incidents: {results['total_incidents']}\n")
-        f.write(f"Total cost (SEK): {format_sek(results['total_cost'])}\n\n")
-
-        # executive summary
-        f.write("\n" + "=" * 90 + "\n")
-        f.write("Executive Summary:")
-        f.write("\n" + "=" * 90 + "\n")
-
-        tor02_incidents = [r for r in results["rows"] if r.get("device_hostname") == "SW-DC-TOR-02"]
-        if tor02_incidents:
-            weeks = {r.get("week_number") for r in tor02_incidents if r.get("week_number")}
-            f.write(
-                f"⚠ CRITICAL: SW-DC-TOR–02 stands out as the most frequent device with repeated failures\n"
-                f"({len(tor02_incidents)} incidents across {len(weeks)} weeks)\n\n"
-            )
-            
-        if results["rows"]:
-            most_expensive = max(results["rows"], key=lambda r: r.get("cost_sek", 0) or 0)
-            f.write(
-                f"⚠ Most expensive incident: {format_sek(most_expensive.get('cost_sek', 0))} SEK "
-                f"(Ticket {most_expensive.get('ticket_id')}, {most_expensive.get('device_hostname')}, "
-                f"{most_expensive.get('site')})\n\n"
-            )
-
-        total = results['total_incidents']
-        crit_count = results["per_severity"].get("critical", {}).get("count", 0)
-        non_crit = total - crit_count
-        f.write(
-            f"✓ Majority of incidents were non-critical ({non_crit} of {total})\n\n"
-            )
 
-        # incidents by severity
-        f.write("\n" + "=" * 75 + "\n")
-        f.write("Incidents by severity:")
-        f.write( "\n" + "=" * 75 + "\n")
-        f.write(format_columns(
-            ["Severity", "Count", "Avg Res (min)", "Avg Cost (SEK)"],
-            [18, 18, 18, 18]
-        ))
-        f.write("-" * 75 + "\n")
-        severity_order = {"critical":1, "high": 2, "medium": 3, "low": 4}
-        for sev, data in sorted(results["per_severity"].items(), 
-            key=lambda x: severity_order.get(x[0].lower(), 99)):
-            f.write(format_columns(
-                [
-                    sev.capitalize(), 
-                    data['count'], 
-                    data['avg_res'], 
-                    format_sek(data['avg_cost'])
-                ],
-                [18, 18, 18, 18],
+    # incidents affecting more than 100 users
+    write("\n\n" + SEP90)
+    write(f"Incidents affecting more than 100 users ({len(results['big_incidents'])})")
+    write("\n" + SEP90)
+    write(_row5(
+        "Ticket", 
+        "Device", 
+        "Site", 
+        "Affected Users", 
+        "Cost (SEK)"
+    ))
+
+    write(DASH90)
+
+    for r in results["big_incidents"]:
+        write(_row5(
+            r.ticket_id or "-",
+            r.device_hostname or "-",
+            r.site or "-",
+            r.affected_users,
+            format_sek(r.cost_sek)
         ))
 
-        # incidents affecting more than 100 users
-        f.write("\n\n" + "=" * 90 + "\n")
-        f.write(f"Incidents affecting more than 100 users ({len(results['big_incidents'])})")
-        f.write("\n" + "=" * 90 + "\n")
-        f.write(format_columns(
-            [
-                "Ticket", 
-                "Device", 
-                "Site", 
-                "Affected Users", 
-                "Cost (SEK)"
-            ],
-            [18, 18, 18, 18, 18]
+    # top 5 incidents by cost
+    write("\n\n" + SEP90)
+    write("Top 5 incidents by cost:")
+    write("\n" + SEP90)
+    write(_row5(
+        "Ticket", 
+        "Device", 
+        "Site", 
+        "Category", 
+        "Cost (SEK)"
+    ))
+    write(DASH90)
+
+    for i, t in enumerate(results["top5"], 1):
+        write(_row5(
+            t.ticket_id or '-',
+            t.device_hostname or '-',
+            t.site or '-',
+            t.category or '-',
+            format_sek(t.cost_sek)
+        ))   
+
+    # average impact score
+    write("\n\n" + SEP75)
+    write("Incidents per category with average impact score:")
+    write("\n" + SEP75)
+    write(_row3("Category", "Count", "Avg Impact Score"))
+    write(DASH75)
+    
+    
+    for cat, score in sorted(results["avg_cat_scores"].items()):
+        count = results["cat_counts"].get(cat, 0)
+        write(_row3(
+            cat, 
+            count, 
+            score
         ))
+    write("\n\n" + SEP90)
+    write("|                                     RECOMMENDATIONS                                    |")
+    write("\n" + SEP90 + "\n")
 
-        f.write("-" * 90 + "\n")
-
-        for r in results["big_incidents"]:
-            f.write(format_columns(
-                [
-                    r.get("ticket_id", "-"),
-                    r.get("device_hostname", "-"),
-                    r.get("site", "-"),
-                    r.get("affected_users", 0),
-                    format_sek(r.get("cost_sek", 0.0))
-                ],
-                [18, 18, 18, 18, 18]
-            ))
-
-        # top 5 incidents by cost
-        f.write("\n\n" + "=" * 90 + "\n")
-        f.write("Top 5 incidents by cost:")
-        f.write("\n" + "=" * 90 + "\n")
-        f.write(format_columns(
-            [
-                "Ticket", 
-                "Device", 
-                "Site", 
-                "Category", 
-                "Cost (SEK)"
-            ],
-            [18, 18, 18, 18, 18],
-        ))
-        f.write("-" * 90 + "\n")
-
-        for i, t in enumerate(results["top5"], 1):
-            f.write(format_columns(
-                [
-                    t.get('ticket_id','-'),
-                    t.get('device_hostname','-'),
-                    t.get('site', '-'),
-                    t.get('category','-'),
-                    format_sek(t.get('cost_sek',0.0)) 
-                ],
-                [18, 18, 18, 18, 18],    
-            ))   
-
-        # average impact score
-        f.write("\n\n" + "=" * 75 + "\n")
-        f.write("Incidents per category with average impact score:")
-        f.write("\n" + "=" * 75 + "\n")
-        f.write(format_columns(["Category", "Count", "Avg Impact Score"],
-            [18, 18, 18]
-        ))
-        f.write("-" * 75 + "\n")
-        
-        
-        for cat, score in sorted(results["avg_cat_scores"].items()):
-            count = results["cat_counts"].get(cat, 0)
-            f.write(format_columns(
-                [
-                    cat, 
-                    count, 
-                    score
-                ],
-                [18, 18, 18]
-            ))
-        f.write("\n\n" + "=" * 90 + "\n")
-        f.write("|                                     RECOMMENDATIONS                                    |")
-        f.write("\n" + "=" * 90 + "\n\n")
-
-        f.write("CRITICAL ⚠\n")
-        f.write(". SW-DC-TOR-02 (Datacenter, switch), 4 incidents, 86 048 SEK\n")
-        f.write("> Replace or add redundancy, perform root cause analysis \n\n")
-
-        f.write("HIGH\n")
-        f.write(". RT-LAGER-01 (Lager, router) - 3 incidents, 34 901 SEK\n")
-        f.write("> Review configuration and redundancy \n\n")
-        f.write(". AP-FLOOR2-02 (Huvudkontor, access_point) - 2 incidents, severity 3.5 \n")
-        f.write("> Add load balancing for more APs\n\n")
-
-        f.write("MEDIUM\n")
-        f.write(". FW-DC-01 (Datacenter, firewall) - 2 incidents, 133 users affected \n")
-        f.write("> Increase monitoring, check capacity \n\n")
-
-        f.write("LOW\n")
-        f.write(". Devices with single low-cost incidents (e.g. FW-MAL-01, SW-DIST-01) \n")
-        f.write("> Monitor, address during planned maintenance \n\n")
-
-        f.write("=" * 90 + "\n")
-        f.write("|                                      END OF REPORT                                     |")
-        f.write("\n" + "=" * 90 + "\n")
+    write("CRITICAL ⚠\n")
+    write(". SW-DC-TOR-02 (Datacenter, switch), 4 incidents, 86 048 SEK\n")
+    write("> Replace or add redundancy, perform root cause analysis \n\n")
+
+    write("HIGH\n")
+    write(". RT-LAGER-01 (Lager, router) - 3 incidents, 34 901 SEK\n")
+    write("> Review configuration and redundancy \n\n")
+    write(". AP-FLOOR2-02 (Huvudkontor, access_point) - 2 incidents, severity 3.5 \n")
+    write("> Add load balancing for more APs\n\n")
+
+    write("MEDIUM\n")
+    write(". FW-DC-01 (Datacenter, firewall) - 2 incidents, 133 users affected \n")
+    write("> Increase monitoring, check capacity \n\n")
+
+    write("LOW\n")
+    write(". Devices with single low-cost incidents (e.g. FW-MAL-01, SW-DIST-01) \n")
+    write("> Monitor, address during planned maintenance \n\n")
+
+    write(SEP90)
+    write("|                                      END OF REPORT                                     |")
+    write("\n" + SEP90)
+
+    with open(out_txt, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+        f.write("".join(parts))
 
 # --------------------
-# entrypoint: run analysis and produce text report only
+# entrypoint: run analysis, then write the csv files and the text report
+# concurrently since they only read results and are I/O bound
 # --------------------
 def main():
     results = network_incidents()
-    incident_analysis(results)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [
+            ex.submit(write, results)
+            for write in (incidents_by_site, problem_devices, cost_analysis, incident_analysis)
+        ]
+        for fut in futures:
+            fut.result()
     print(f"{OUT_TXT} created ({results['total_incidents']} incidents)")
 
 if __name__ == "__main__":